@@ -12,6 +12,7 @@ import warnings
 import numpy as np
 import numbers
 from numba import njit
+from scipy.special import ndtr, gammaln, xlogy
 
 
 def rouwenhorst(n, rho, sigma, mu=0.):
@@ -115,31 +116,31 @@ def rouwenhorst(n, rho, sigma, mu=0.):
         This method uses the values of p and q to build the transition
         matrix for the rouwenhorst method
 
-        """
-
-        if n == 2:
-            theta = np.array([[p, 1 - p], [1 - q, q]])
-
-        elif n > 2:
-            p1 = np.zeros((n, n))
-            p2 = np.zeros((n, n))
-            p3 = np.zeros((n, n))
-            p4 = np.zeros((n, n))
-
-            new_mat = row_build_mat(n - 1, p, q)
+        Row i of the matrix is the distribution of the sum of two
+        independent binomial draws, Bin(i, q) and Bin(n-1-i, 1-p), so
+        each row is computed directly as the convolution of their
+        probability mass functions instead of by recursion on n.
 
-            p1[:n - 1, :n - 1] = p * new_mat
-            p2[:n - 1, 1:] = (1 - p) * new_mat
-            p3[1:, :-1] = (1 - q) * new_mat
-            p4[1:, 1:] = q * new_mat
-
-            theta = p1 + p2 + p3 + p4
-            theta[1:n - 1, :] = theta[1:n - 1, :] / 2
+        """
 
-        else:
+        if n < 2:
             raise ValueError("The number of states must be positive " +
                              "and greater than or equal to 2")
 
+        # Row i of A (B) holds the pmf of Bin(i, q) (Bin(n-1-i, 1-p)),
+        # computed in log space so that large binomial coefficients do not
+        # overflow; only the entries with k within the support are used
+        k = np.arange(n)
+        i = k[:, np.newaxis]
+        j = np.maximum(i - k, 0)
+        log_C = gammaln(i + 1) - gammaln(k + 1) - gammaln(j + 1)
+        A = np.exp(log_C + xlogy(k, q) + xlogy(j, 1 - q))
+        B = np.exp(log_C[::-1] + xlogy(k, 1 - p) + xlogy(j[::-1], p))
+
+        theta = np.empty((n, n))
+        for i in range(n):
+            theta[i, :] = np.convolve(A[i, :i + 1], B[i, :n - i])
+
         return theta
 
     theta = row_build_mat(n, p, q)
@@ -227,18 +228,20 @@ def tauchen(n, rho, sigma, mu=0., n_std=3):
     return mc
 
 
-@njit
+@njit(cache=True)
 def std_norm_cdf(x):
     return 0.5 * erfc(-x / sqrt(2))
 
 
-@njit
 def _fill_tauchen(x, P, n, rho, sigma, half_step):
-    for i in range(n):
-        P[i, 0] = std_norm_cdf((x[0] - rho * x[i] + half_step) / sigma)
-        P[i, n - 1] = 1 - \
-            std_norm_cdf((x[n - 1] - rho * x[i] - half_step) / sigma)
-        for j in range(1, n - 1):
-            z = x[j] - rho * x[i]
-            P[i, j] = (std_norm_cdf((z + half_step) / sigma) -
-                       std_norm_cdf((z - half_step) / sigma))
+    if n == 1:
+        P[:] = 1
+        return
+
+    # CDF at the n-1 interior bin edges x[j] + half_step, for each row i;
+    # the upper edge of bin j is the lower edge of bin j+1
+    F = ndtr((x[np.newaxis, :n - 1] + half_step - rho * x[:, np.newaxis]) /
+             sigma)
+    P[:, 0] = F[:, 0]
+    P[:, 1:n - 1] = F[:, 1:] - F[:, :n - 2]
+    P[:, n - 1] = 1 - F[:, n - 2]
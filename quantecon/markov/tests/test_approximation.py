@@ -6,6 +6,7 @@ import numpy as np
 import pytest
 from quantecon.markov import tauchen, rouwenhorst
 from numpy.testing import assert_, assert_allclose, assert_raises
+from scipy.stats import norm
 
 #from quantecon.markov.approximation import rouwenhorst
 
@@ -52,6 +53,25 @@ class TestTauchen:
     def test_states_sum_0(self):
         assert_(abs(np.sum(self.x)) < self.tol)
 
+    def test_control_case(self):
+        n, rho, sigma, n_std = 5, 0.9, 0.5, 2
+        mc = tauchen(n, rho, sigma, n_std=n_std)
+        x = mc.state_values
+        half_step = (x[1] - x[0]) / 2
+        P_expected = np.empty((n, n))
+        for i in range(n):
+            z = x - rho * x[i]
+            P_expected[i, :] = \
+                norm.cdf((z + half_step) / sigma) - \
+                norm.cdf((z - half_step) / sigma)
+            P_expected[i, 0] = norm.cdf((z[0] + half_step) / sigma)
+            P_expected[i, -1] = 1 - norm.cdf((z[-1] - half_step) / sigma)
+        assert_allclose(mc.P, P_expected, atol=self.tol)
+
+    def test_single_state(self):
+        mc = tauchen(1, self.rho, self.sigma)
+        assert_allclose(mc.P, [[1.]])
+
     def test_old_tauchen_api_warning(self):
         # Test the warning
         with pytest.warns(UserWarning):
@@ -59,6 +79,20 @@ class TestTauchen:
             assert_raises(TypeError, tauchen, 4.0, self.rho, self.sigma,
                                 self.mu, self.n_std)
 
+def _rouwenhorst_recursive(n, p, q):
+    # Reference: the recursive construction of the Rouwenhorst matrix
+    if n == 2:
+        return np.array([[p, 1 - p], [1 - q, q]])
+    theta_prev = _rouwenhorst_recursive(n - 1, p, q)
+    theta = np.zeros((n, n))
+    theta[:-1, :-1] += p * theta_prev
+    theta[:-1, 1:] += (1 - p) * theta_prev
+    theta[1:, :-1] += (1 - q) * theta_prev
+    theta[1:, 1:] += q * theta_prev
+    theta[1:-1, :] /= 2
+    return theta
+
+
 class TestRouwenhorst:
 
     def setup_method(self):
@@ -107,3 +141,19 @@ class TestRouwenhorst:
             [[0.81, 0.18, 0.01], [0.09, 0.82, 0.09], [0.01, 0.18, 0.81]])
         assert_(np.sum(mc_rouwenhorst.x - known_x) < self.tol and
                 np.sum(mc_rouwenhorst.P - known_P) < self.tol)
+
+    def test_recursive_construction(self):
+        for n in [5, 12]:
+            for rho in [0.1, 0.9, 0.999]:
+                with pytest.warns(UserWarning):
+                    mc = rouwenhorst(n, rho, self.sigma)
+                p = (1 + rho) / 2
+                assert_allclose(mc.P, _rouwenhorst_recursive(n, p, p),
+                                rtol=1e-12, atol=1e-15)
+
+    def test_large_n(self):
+        for n in [1000, 1500]:
+            with pytest.warns(UserWarning):
+                mc = rouwenhorst(n, self.rho, self.sigma)
+            assert_(np.all(np.isfinite(mc.P)))
+            assert_allclose(np.sum(mc.P, axis=1), 1, atol=self.tol)